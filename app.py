@@ -6,31 +6,143 @@ through a user-friendly web interface. Users enter a city name and receive
 current weather data with appropriate clothing suggestions.
 """
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+import asyncio
+import hashlib
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import httpx
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 import uvicorn
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
 
+from config import settings
 from weather_server import (
-    get_coordinates,
-    get_weather,
-    recommend_clothing
+    HTTP_CLIENT,
+    OPENAI_HTTP_CLIENT,
+    openai_client,
+    fetch_city_forecast,
+    warm_weather_descriptions
 )
 
 
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson's C encoder instead of the stdlib json.
+
+    Equivalent to FastAPI's ORJSONResponse, defined here so it works the same
+    across FastAPI versions (newer releases deprecate the built-in one).
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Stylesheet and script for the landing page
+STATIC_DIR = Path(__file__).parent / "static"
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """
+    Static files served with a one-year, immutable Cache-Control header.
+
+    Asset URLs carry a content fingerprint (``?v=...``), so a changed file
+    gets a new URL and browsers never need to revalidate the old one.
+    """
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+def _asset_version(name: str) -> str:
+    """
+    Return a short content fingerprint for a static asset, for cache busting.
+
+    Args:
+        name: File name inside STATIC_DIR
+
+    Returns:
+        The first 12 hex digits of the file's MD5 hash
+    """
+    return hashlib.md5((STATIC_DIR / name).read_bytes()).hexdigest()[:12]
+
+
+# Open-Meteo APIs whose connections are opened at startup
+UPSTREAM_URLS = (
+    "https://geocoding-api.open-meteo.com",
+    "https://api.open-meteo.com"
+)
+
+
+async def _prewarm_connections(client: httpx.AsyncClient, urls):
+    """
+    Open pooled connections to upstream APIs before the first request.
+
+    Each host gets a cheap HEAD request so DNS, TCP and TLS setup are done
+    ahead of time and the first lookups reuse a warm connection. Failures
+    are ignored; a request will simply open its own connection.
+
+    Args:
+        client: Shared HTTP client whose pool should be warmed
+        urls: Base URLs of the hosts to connect to
+    """
+    async def warm(url: str):
+        try:
+            await client.head(url)
+        except httpx.HTTPError:
+            pass
+
+    async with asyncio.TaskGroup() as tg:
+        for url in urls:
+            tg.create_task(warm(url))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Manage background work for the lifetime of the application.
+
+    Warms the shared HTTP clients' connections to Open-Meteo and, when it
+    is configured, OpenAI, fills in descriptions for unknown weather codes,
+    and closes the clients on shutdown.
+    """
+    prewarms = [
+        asyncio.create_task(_prewarm_connections(HTTP_CLIENT, UPSTREAM_URLS)),
+        asyncio.create_task(warm_weather_descriptions())
+    ]
+    if openai_client is not None:
+        prewarms.append(asyncio.create_task(
+            _prewarm_connections(OPENAI_HTTP_CLIENT, (str(openai_client.base_url),))
+        ))
+    yield
+    for prewarm in prewarms:
+        prewarm.cancel()
+    await HTTP_CLIENT.aclose()
+    await OPENAI_HTTP_CLIENT.aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Weather & Clothing Recommendation API",
     description="Get weather information and clothing recommendations for any city",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=OrjsonResponse,
+    lifespan=lifespan
 )
 
+# Compress larger responses; the landing page shrinks several times over
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+app.mount("/static", ImmutableStaticFiles(directory=STATIC_DIR), name="static")
+
 
 class CityRequest(BaseModel):
     """
@@ -40,6 +152,8 @@ class CityRequest(BaseModel):
         city: Name of the city to get weather for
         activity: Optional activity the user is planning
     """
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
     city: str
     activity: Optional[str] = "general outdoor activities"
 
@@ -55,6 +169,8 @@ class WeatherResponse(BaseModel):
         clothing: Clothing recommendations based on weather
         activity: Activity the recommendations are for
     """
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
     city: str
     coordinates: dict
     weather: dict
@@ -62,259 +178,49 @@ class WeatherResponse(BaseModel):
     activity: str
 
 
-@app.get("/", response_class=HTMLResponse)
-async def read_root():
+class BatchCityRequest(BaseModel):
     """
-    Serve the main HTML page.
+    Request model for looking up several cities at once.
 
-    Returns the web interface where users can input city names
-    and view weather and clothing recommendations.
+    Attributes:
+        cities: Names of the cities to get weather for (1-20)
+        activity: Optional activity the user is planning
+    """
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    cities: list[str] = Field(min_length=1, max_length=20)
+    activity: Optional[str] = "general outdoor activities"
+
+
+class BatchWeatherResponse(BaseModel):
     """
-    return """
+    Response model for a multi-city lookup.
+
+    Attributes:
+        results: Weather and clothing data for each city that succeeded,
+                 in request order
+        errors: Error message for each city that failed, keyed by city name
+    """
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    results: list[WeatherResponse]
+    errors: dict[str, str]
+
+
+# Fingerprinted asset URLs for the landing page
+_APP_CSS_URL = f"/static/app.css?v={_asset_version('app.css')}"
+_APP_JS_URL = f"/static/app.js?v={_asset_version('app.js')}"
+
+# Landing page, encoded once at import so each request only ships bytes
+INDEX_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Weather & Clothing Advisor</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-        }
-
-        .container {
-            background: white;
-            border-radius: 20px;
-            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-            max-width: 800px;
-            width: 100%;
-            padding: 40px;
-        }
-
-        h1 {
-            text-align: center;
-            color: #667eea;
-            margin-bottom: 10px;
-            font-size: 2.5em;
-        }
-
-        .subtitle {
-            text-align: center;
-            color: #666;
-            margin-bottom: 30px;
-            font-size: 1.1em;
-        }
-
-        .input-group {
-            margin-bottom: 20px;
-        }
-
-        label {
-            display: block;
-            margin-bottom: 8px;
-            color: #333;
-            font-weight: 600;
-            font-size: 1.1em;
-        }
-
-        input {
-            width: 100%;
-            padding: 15px;
-            border: 2px solid #e0e0e0;
-            border-radius: 10px;
-            font-size: 1em;
-            transition: all 0.3s;
-        }
-
-        input:focus {
-            outline: none;
-            border-color: #667eea;
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        }
-
-        button {
-            width: 100%;
-            padding: 15px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-            border-radius: 10px;
-            font-size: 1.1em;
-            font-weight: 600;
-            cursor: pointer;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }
-
-        button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 5px 20px rgba(102, 126, 234, 0.4);
-        }
-
-        button:active {
-            transform: translateY(0);
-        }
-
-        button:disabled {
-            opacity: 0.6;
-            cursor: not-allowed;
-            transform: none;
-        }
-
-        .loading {
-            text-align: center;
-            padding: 20px;
-            display: none;
-        }
-
-        .spinner {
-            border: 4px solid #f3f3f3;
-            border-top: 4px solid #667eea;
-            border-radius: 50%;
-            width: 40px;
-            height: 40px;
-            animation: spin 1s linear infinite;
-            margin: 0 auto;
-        }
-
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-
-        .error {
-            background: #fee;
-            border: 2px solid #fcc;
-            color: #c33;
-            padding: 15px;
-            border-radius: 10px;
-            margin-top: 20px;
-            display: none;
-        }
-
-        .results {
-            margin-top: 30px;
-            display: none;
-        }
-
-        .weather-card {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 25px;
-            border-radius: 15px;
-            margin-bottom: 20px;
-        }
-
-        .weather-card h2 {
-            margin-bottom: 15px;
-            font-size: 1.8em;
-        }
-
-        .weather-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 15px;
-            margin-top: 15px;
-        }
-
-        .weather-item {
-            background: rgba(255, 255, 255, 0.2);
-            padding: 15px;
-            border-radius: 10px;
-            text-align: center;
-        }
-
-        .weather-item .label {
-            font-size: 0.9em;
-            opacity: 0.9;
-            margin-bottom: 5px;
-        }
-
-        .weather-item .value {
-            font-size: 1.5em;
-            font-weight: bold;
-        }
-
-        .clothing-section {
-            background: #f8f9fa;
-            padding: 25px;
-            border-radius: 15px;
-            margin-bottom: 15px;
-        }
-
-        .clothing-section h3 {
-            color: #667eea;
-            margin-bottom: 15px;
-            font-size: 1.4em;
-        }
-
-        .clothing-list {
-            list-style: none;
-        }
-
-        .clothing-list li {
-            padding: 10px 0;
-            border-bottom: 1px solid #e0e0e0;
-            display: flex;
-            align-items: center;
-        }
-
-        .clothing-list li:last-child {
-            border-bottom: none;
-        }
-
-        .clothing-list li:before {
-            content: "✓";
-            display: inline-block;
-            width: 25px;
-            height: 25px;
-            background: #667eea;
-            color: white;
-            border-radius: 50%;
-            text-align: center;
-            line-height: 25px;
-            margin-right: 10px;
-            font-weight: bold;
-        }
-
-        .advice-box {
-            background: #fff3cd;
-            border-left: 4px solid #ffc107;
-            padding: 15px;
-            border-radius: 5px;
-            margin-top: 10px;
-        }
-
-        .advice-box p {
-            margin: 5px 0;
-            color: #856404;
-        }
-
-        @media (max-width: 600px) {
-            .container {
-                padding: 20px;
-            }
-
-            h1 {
-                font-size: 2em;
-            }
-
-            .weather-grid {
-                grid-template-columns: 1fr 1fr;
-            }
-        }
-    </style>
+    <link rel="stylesheet" href="{app_css_url}">
+    <script src="{app_js_url}" defer></script>
 </head>
 <body>
     <div class="container">
@@ -398,109 +304,75 @@ async def read_root():
             </div>
         </div>
     </div>
-
-    <script>
-        const form = document.getElementById('weatherForm');
-        const loading = document.getElementById('loading');
-        const error = document.getElementById('error');
-        const results = document.getElementById('results');
-        const submitBtn = document.getElementById('submitBtn');
-
-        form.addEventListener('submit', async (e) => {
-            e.preventDefault();
-
-            // Get form values
-            const city = document.getElementById('city').value.trim();
-            const activity = document.getElementById('activity').value.trim() || 'general outdoor activities';
-
-            // Hide previous results and errors
-            results.style.display = 'none';
-            error.style.display = 'none';
-            loading.style.display = 'block';
-            submitBtn.disabled = true;
-
-            try {
-                // Call API
-                const response = await fetch('/api/weather', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({ city, activity })
-                });
-
-                const data = await response.json();
-
-                if (!response.ok) {
-                    throw new Error(data.detail || 'Failed to fetch weather data');
-                }
-
-                // Display results
-                displayResults(data);
-
-            } catch (err) {
-                // Show error
-                error.textContent = err.message;
-                error.style.display = 'block';
-            } finally {
-                loading.style.display = 'none';
-                submitBtn.disabled = false;
-            }
-        });
-
-        function displayResults(data) {
-            // City and activity
-            document.getElementById('cityName').textContent = data.city;
-            document.getElementById('activityText').textContent = `Activity: ${data.activity}`;
-
-            // Weather data
-            document.getElementById('temperature').textContent = `${data.weather.temperature}°C`;
-            document.getElementById('conditions').textContent = data.weather.weather_description;
-            document.getElementById('windSpeed').textContent = `${data.weather.wind_speed} km/h`;
-            document.getElementById('humidity').textContent = `${data.weather.humidity}%`;
-
-            // Clothing layers
-            const layersList = document.getElementById('layers');
-            layersList.innerHTML = '';
-            data.clothing.layers.forEach(layer => {
-                const li = document.createElement('li');
-                li.textContent = layer;
-                layersList.appendChild(li);
-            });
-
-            // Accessories
-            const accessoriesList = document.getElementById('accessories');
-            accessoriesList.innerHTML = '';
-            data.clothing.accessories.forEach(accessory => {
-                const li = document.createElement('li');
-                li.textContent = accessory;
-                accessoriesList.appendChild(li);
-            });
-
-            // Footwear
-            document.getElementById('footwear').textContent = data.clothing.footwear;
-
-            // Advice
-            const adviceBox = document.getElementById('advice');
-            adviceBox.innerHTML = '';
-            data.clothing.general_advice.forEach(tip => {
-                const p = document.createElement('p');
-                p.textContent = `• ${tip}`;
-                adviceBox.appendChild(p);
-            });
-
-            // Show results
-            results.style.display = 'block';
-            results.scrollIntoView({ behavior: 'smooth' });
-        }
-    </script>
 </body>
 </html>
+""".format(app_css_url=_APP_CSS_URL, app_js_url=_APP_JS_URL)
+
+_INDEX_HTML_BYTES = INDEX_HTML.encode("utf-8")
+_INDEX_ETAG = f'"{hashlib.md5(_INDEX_HTML_BYTES).hexdigest()}"'
+_INDEX_HEADERS = {
+    "ETag": _INDEX_ETAG,
+    "Cache-Control": "public, max-age=3600",
+    # Let the browser start fetching assets before it parses any HTML
+    "Link": f"<{_APP_CSS_URL}>; rel=preload; as=style, <{_APP_JS_URL}>; rel=preload; as=script"
+}
+
+
+@app.get("/", response_class=HTMLResponse)
+async def read_root(request: Request):
     """
+    Serve the main HTML page.
+
+    Returns the web interface where users can input city names
+    and view weather and clothing recommendations. Browsers that already
+    hold the current page get a 304 Not Modified with no body. The
+    stylesheet and script are announced in a Link preload header and the
+    script is deferred from <head>, so both download while the page parses.
+    """
+    if_none_match = request.headers.get("if-none-match", "")
+    if _INDEX_ETAG in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=_INDEX_HEADERS)
+
+    return Response(
+        content=_INDEX_HTML_BYTES,
+        media_type="text/html; charset=utf-8",
+        headers=_INDEX_HEADERS
+    )
 
 
-@app.post("/api/weather", response_model=WeatherResponse)
-async def get_weather_recommendation(request: CityRequest):
+def _weather_payload(city: str, activity: str, forecast: dict) -> dict:
+    """
+    Build the JSON body for one city, shaped like WeatherResponse.
+
+    The values were just computed server-side, so they are returned as a
+    plain dict instead of being validated through the response model again.
+
+    Args:
+        city: City name as given in the request
+        activity: Planned activity, if any
+        forecast: Bundle returned by fetch_city_forecast()
+
+    Returns:
+        Dictionary shaped like WeatherResponse
+    """
+    return {
+        "city": city,
+        "coordinates": {
+            "latitude": forecast["latitude"],
+            "longitude": forecast["longitude"]
+        },
+        "weather": forecast["weather"],
+        "clothing": forecast["clothing"],
+        "activity": activity
+    }
+
+
+@app.post(
+    "/api/weather",
+    response_model=None,
+    responses={200: {"model": WeatherResponse}}
+)
+async def get_weather_recommendation(request: CityRequest) -> OrjsonResponse:
     """
     Get weather information and clothing recommendations for a city.
 
@@ -512,32 +384,18 @@ async def get_weather_recommendation(request: CityRequest):
         request: CityRequest containing city name and optional activity
 
     Returns:
-        WeatherResponse with complete weather and clothing data
+        JSON response shaped like WeatherResponse, with complete weather and
+        clothing data
 
     Raises:
         HTTPException: If city is not found or weather data cannot be fetched
     """
     try:
-        # Get coordinates for the city
-        latitude, longitude = await get_coordinates(request.city)
-
-        # Fetch weather data
-        weather = await get_weather(latitude, longitude)
-
-        # Get clothing recommendations
-        clothing = recommend_clothing(weather)
+        # Look up coordinates, weather and clothing recommendations
+        forecast = await fetch_city_forecast(request.city)
 
         # Build response
-        return WeatherResponse(
-            city=request.city,
-            coordinates={
-                "latitude": latitude,
-                "longitude": longitude
-            },
-            weather=weather,
-            clothing=clothing,
-            activity=request.activity
-        )
+        return OrjsonResponse(_weather_payload(request.city, request.activity, forecast))
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -545,6 +403,51 @@ async def get_weather_recommendation(request: CityRequest):
         raise HTTPException(status_code=500, detail=f"Error fetching weather data: {str(e)}")
 
 
+@app.post(
+    "/api/weather/batch",
+    response_model=None,
+    responses={200: {"model": BatchWeatherResponse}}
+)
+async def get_weather_recommendations_batch(request: BatchCityRequest) -> OrjsonResponse:
+    """
+    Get weather information and clothing recommendations for several cities.
+
+    All cities are looked up concurrently, so the request takes about as
+    long as the slowest city rather than the sum of all of them. A failing
+    city does not fail the whole batch; it is reported in ``errors``
+    instead.
+
+    Args:
+        request: BatchCityRequest containing city names and optional activity
+
+    Returns:
+        JSON response shaped like BatchWeatherResponse, with per-city
+        results and errors
+    """
+    errors = {}
+
+    def record_error(city: str, error: BaseException):
+        if isinstance(error, ValueError):
+            errors[city] = str(error)
+        else:
+            errors[city] = f"Error fetching weather data: {str(error)}"
+
+    # Look up every city at once
+    forecasts = await asyncio.gather(
+        *(fetch_city_forecast(city) for city in request.cities),
+        return_exceptions=True
+    )
+
+    results = []
+    for city, forecast in zip(request.cities, forecasts):
+        if isinstance(forecast, BaseException):
+            record_error(city, forecast)
+        else:
+            results.append(_weather_payload(city, request.activity, forecast))
+
+    return OrjsonResponse({"results": results, "errors": errors})
+
+
 @app.get("/api/health")
 async def health_check():
     """
@@ -566,4 +469,12 @@ if __name__ == "__main__":
 ╚══════════════════════════════════════════════════════════════════╝
     """)
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvicorn[standard] picks uvloop and httptools automatically when available.
+    # Each worker is a separate process with its own in-memory caches.
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=settings().web_concurrency,
+        access_log=False
+    )
@@ -7,10 +7,17 @@ asking a question to getting structured weather and clothing advice.
 """
 
 import asyncio
-import json
+import os
+import orjson
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
+
+# Model used by the AI assistant demo
+ASSISTANT_MODEL = "claude-3-5-haiku-latest"
+
+# Initialize Anthropic client once (only if API key is available)
+anthropic_client = AsyncAnthropic() if os.getenv("ANTHROPIC_API_KEY") else None
 
 
 async def run_mcp_client():
@@ -71,8 +78,8 @@ async def run_mcp_client():
                 arguments={"city": city}
             )
 
-            weather_data = json.loads(weather_result.content[0].text)
-            print(json.dumps(weather_data, indent=2))
+            weather_data = orjson.loads(weather_result.content[0].text)
+            print(orjson.dumps(weather_data, option=orjson.OPT_INDENT_2).decode())
             print()
 
             # Example 4: Get clothing recommendation
@@ -84,8 +91,8 @@ async def run_mcp_client():
                 arguments={"city": city}
             )
 
-            clothing_data = json.loads(clothing_result.content[0].text)
-            print(json.dumps(clothing_data, indent=2))
+            clothing_data = orjson.loads(clothing_result.content[0].text)
+            print(orjson.dumps(clothing_data, option=orjson.OPT_INDENT_2).decode())
             print()
 
             # Example 5: Use the prompt for activity advice
@@ -124,12 +131,9 @@ async def run_with_ai_assistant():
     print("=" * 70)
     print()
 
-    # Initialize Anthropic client (requires ANTHROPIC_API_KEY environment variable)
-    try:
-        anthropic = Anthropic()
-    except Exception as e:
+    # The Anthropic client requires the ANTHROPIC_API_KEY environment variable
+    if anthropic_client is None:
         print("⚠️  Skipping AI demo: Set ANTHROPIC_API_KEY environment variable")
-        print(f"   Error: {e}")
         return
 
     # Connect to MCP server
@@ -168,19 +172,21 @@ async def run_with_ai_assistant():
             print("🤖 AI ASSISTANT: Processing weather data and generating advice...")
             print()
 
-            response = anthropic.messages.create(
-                model="openai-4_mini",
+            print("💬 AI ASSISTANT RESPONSE:")
+            print("-" * 70)
+
+            # Stream the answer so text appears as soon as it is generated
+            async with anthropic_client.messages.stream(
+                model=ASSISTANT_MODEL,
                 max_tokens=1024,
                 messages=[
                     {"role": "user", "content": prompt_text}
                 ]
-            )
-
-            ai_response = response.content[0].text
+            ) as stream:
+                async for text in stream.text_stream:
+                    print(text, end="", flush=True)
 
-            print("💬 AI ASSISTANT RESPONSE:")
-            print("-" * 70)
-            print(ai_response)
+            print()
             print()
 
             print("=" * 70)
@@ -0,0 +1,48 @@
+"""
+Application Configuration
+
+Reads settings from the environment (and the .env file, if present) once,
+and exposes them as an immutable snapshot shared by the web app and the
+MCP server.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Snapshot of the environment-driven configuration.
+
+    Attributes:
+        openai_api_key: OpenAI API key, or None to use fallback logic only
+        web_concurrency: Number of uvicorn worker processes for the web app
+        open_meteo_rate_limit: Maximum Open-Meteo requests per second, per process
+        cache_dir: Directory holding the persistent lookup cache
+    """
+    openai_api_key: str | None
+    web_concurrency: int
+    open_meteo_rate_limit: float
+    cache_dir: str
+
+
+@lru_cache(maxsize=1)
+def settings() -> Settings:
+    """
+    Load the configuration on first use and return the cached snapshot.
+
+    Returns:
+        The Settings instance for this process
+    """
+    # Load environment variables from .env file
+    load_dotenv()
+
+    return Settings(
+        openai_api_key=os.getenv("OPENAI_API_KEY") or None,
+        web_concurrency=int(os.getenv("WEB_CONCURRENCY", "4")),
+        open_meteo_rate_limit=float(os.getenv("OPEN_METEO_RATE_LIMIT", "10")),
+        cache_dir=os.path.expanduser(os.getenv("WEATHER_CACHE_DIR", "~/.cache/weather_mcp"))
+    )
@@ -8,75 +8,108 @@ that the weather API and recommendation logic work correctly.
 
 import asyncio
 import json
-from weather_server import (
-    get_coordinates,
-    get_weather,
-    recommend_clothing,
-    get_weather_description
-)
+import threading
+from weather_server import fetch_city_forecast
 
 
-async def test_weather_and_clothing(city: str):
+# Maximum number of cities fetched at the same time in the multi-city test
+MAX_CONCURRENT_CITIES = 5
+
+
+async def fetch_weather_and_clothing(city: str) -> dict:
     """
-    Test weather fetching and clothing recommendations for a city.
+    Fetch coordinates, weather and clothing recommendations for a city.
 
     Args:
         city: Name of the city to check
+
+    Returns:
+        Dictionary with latitude, longitude, weather and clothing entries
+    """
+    return await fetch_city_forecast(city)
+
+
+def print_weather_and_clothing(city: str, result: dict | Exception):
+    """
+    Print the test report for a city.
+
+    Args:
+        city: Name of the city that was checked
+        result: Output of fetch_weather_and_clothing, or the error it raised
     """
     print("=" * 70)
     print(f"WEATHER AND CLOTHING TEST FOR: {city.upper()}")
     print("=" * 70)
     print()
 
-    try:
-        # Step 1: Get coordinates
-        print("📍 Step 1: Getting coordinates...")
-        latitude, longitude = await get_coordinates(city)
-        print(f"   Coordinates: {latitude}°N, {longitude}°E")
-        print()
-
-        # Step 2: Fetch weather
-        print("🌤️  Step 2: Fetching weather data...")
-        weather = await get_weather(latitude, longitude)
-        print(f"   Temperature: {weather['temperature']}°C")
-        print(f"   Conditions: {weather['weather_description']}")
-        print(f"   Wind Speed: {weather['wind_speed']} km/h")
-        print(f"   Humidity: {weather['humidity']}%")
-        print()
-
-        # Step 3: Get clothing recommendations
-        print("👕 Step 3: Generating clothing recommendations...")
-        clothing = recommend_clothing(weather)
-
-        print("\n   CLOTHING LAYERS:")
-        for layer in clothing['layers']:
-            print(f"     • {layer}")
-
-        print("\n   ACCESSORIES:")
-        for accessory in clothing['accessories']:
-            print(f"     • {accessory}")
-
-        print(f"\n   FOOTWEAR:")
-        print(f"     • {clothing['footwear']}")
-
-        print("\n   GENERAL ADVICE:")
-        for advice in clothing['general_advice']:
-            print(f"     • {advice}")
-
-        print()
-        print("=" * 70)
-        print("✅ TEST COMPLETED SUCCESSFULLY")
+    if isinstance(result, Exception):
+        print(f"❌ ERROR: {result}")
         print("=" * 70)
+        return
+
+    weather = result["weather"]
+    clothing = result["clothing"]
+
+    # Step 1: Coordinates
+    print("📍 Step 1: Getting coordinates...")
+    print(f"   Coordinates: {result['latitude']}°N, {result['longitude']}°E")
+    print()
+
+    # Step 2: Weather
+    print("🌤️  Step 2: Fetching weather data...")
+    print(f"   Temperature: {weather['temperature']}°C")
+    print(f"   Conditions: {weather['weather_description']}")
+    print(f"   Wind Speed: {weather['wind_speed']} km/h")
+    print(f"   Humidity: {weather['humidity']}%")
+    print()
+
+    # Step 3: Clothing recommendations
+    print("👕 Step 3: Generating clothing recommendations...")
+
+    print("\n   CLOTHING LAYERS:")
+    for layer in clothing['layers']:
+        print(f"     • {layer}")
+
+    print("\n   ACCESSORIES:")
+    for accessory in clothing['accessories']:
+        print(f"     • {accessory}")
+
+    print(f"\n   FOOTWEAR:")
+    print(f"     • {clothing['footwear']}")
+
+    print("\n   GENERAL ADVICE:")
+    for advice in clothing['general_advice']:
+        print(f"     • {advice}")
+
+    print()
+    print("=" * 70)
+    print("✅ TEST COMPLETED SUCCESSFULLY")
+    print("=" * 70)
+
 
+async def test_weather_and_clothing(city: str):
+    """
+    Test weather fetching and clothing recommendations for a city.
+
+    Args:
+        city: Name of the city to check
+    """
+    try:
+        result = await fetch_weather_and_clothing(city)
     except Exception as e:
-        print(f"❌ ERROR: {e}")
-        print("=" * 70)
+        result = e
+
+    print_weather_and_clothing(city, result)
 
 
 async def test_multiple_cities():
     """
     Test weather and clothing recommendations for multiple cities
     to show how recommendations vary by weather conditions.
+
+    Cities are fetched concurrently (at most MAX_CONCURRENT_CITIES at a
+    time, to stay polite to the API) and reported in order once all
+    have finished.
     """
     cities = ["Paris", "Tokyo", "New York", "Sydney", "Moscow"]
 
@@ -85,10 +118,58 @@ async def test_multiple_cities():
     print("=" * 70)
     print()
 
-    for city in cities:
-        await test_weather_and_clothing(city)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CITIES)
+
+    async def fetch(city: str) -> dict:
+        async with semaphore:
+            return await fetch_weather_and_clothing(city)
+
+    results = await asyncio.gather(
+        *(fetch(city) for city in cities),
+        return_exceptions=True
+    )
+
+    for city, result in zip(cities, results):
+        print_weather_and_clothing(city, result)
         print("\n")
-        await asyncio.sleep(1)  # Be nice to the API
+
+
+async def read_input(prompt: str) -> str:
+    """
+    Read a line from standard input without blocking the event loop.
+
+    input() runs on a daemon thread, so other tasks keep running while the
+    user types, and Ctrl+C can exit without waiting for a pending read.
+
+    Args:
+        prompt: Text shown before the cursor
+
+    Returns:
+        The line entered by the user
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(line, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line)
+
+    def read():
+        try:
+            line, error = input(prompt), None
+        except BaseException as e:
+            line, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, line, error)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
 
 
 async def interactive_mode():
@@ -106,7 +187,7 @@ async def interactive_mode():
 
     while True:
         try:
-            city = input("Enter city name: ").strip()
+            city = (await read_input("Enter city name: ")).strip()
 
             if city.lower() in ['quit', 'exit', 'q']:
                 print("\nGoodbye! 👋")
@@ -119,7 +200,8 @@ async def interactive_mode():
             await test_weather_and_clothing(city)
             print("\n")
 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Ctrl+C while awaiting input arrives as a cancellation
             print("\n\nInterrupted. Goodbye! 👋")
             break
         except Exception as e:
@@ -149,7 +231,7 @@ async def main():
     print()
 
     try:
-        choice = input("Enter choice (1-3): ").strip()
+        choice = (await read_input("Enter choice (1-3): ")).strip()
 
         if choice == "1":
             await test_weather_and_clothing("Paris")
@@ -161,7 +243,7 @@ async def main():
             print("Invalid choice. Running default test for Paris...")
             await test_weather_and_clothing("Paris")
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n\nInterrupted. Goodbye! 👋")
 
 
@@ -0,0 +1,93 @@
+const form = document.getElementById('weatherForm');
+const loading = document.getElementById('loading');
+const error = document.getElementById('error');
+const results = document.getElementById('results');
+const submitBtn = document.getElementById('submitBtn');
+
+form.addEventListener('submit', async (e) => {
+    e.preventDefault();
+
+    // Get form values
+    const city = document.getElementById('city').value.trim();
+    const activity = document.getElementById('activity').value.trim() || 'general outdoor activities';
+
+    // Hide previous results and errors
+    results.style.display = 'none';
+    error.style.display = 'none';
+    loading.style.display = 'block';
+    submitBtn.disabled = true;
+
+    try {
+        // Call API
+        const response = await fetch('/api/weather', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ city, activity })
+        });
+
+        const data = await response.json();
+
+        if (!response.ok) {
+            throw new Error(data.detail || 'Failed to fetch weather data');
+        }
+
+        // Display results
+        displayResults(data);
+
+    } catch (err) {
+        // Show error
+        error.textContent = err.message;
+        error.style.display = 'block';
+    } finally {
+        loading.style.display = 'none';
+        submitBtn.disabled = false;
+    }
+});
+
+function displayResults(data) {
+    // City and activity
+    document.getElementById('cityName').textContent = data.city;
+    document.getElementById('activityText').textContent = `Activity: ${data.activity}`;
+
+    // Weather data
+    document.getElementById('temperature').textContent = `${data.weather.temperature}°C`;
+    document.getElementById('conditions').textContent = data.weather.weather_description;
+    document.getElementById('windSpeed').textContent = `${data.weather.wind_speed} km/h`;
+    document.getElementById('humidity').textContent = `${data.weather.humidity}%`;
+
+    // Clothing layers
+    const layersList = document.getElementById('layers');
+    layersList.innerHTML = '';
+    data.clothing.layers.forEach(layer => {
+        const li = document.createElement('li');
+        li.textContent = layer;
+        layersList.appendChild(li);
+    });
+
+    // Accessories
+    const accessoriesList = document.getElementById('accessories');
+    accessoriesList.innerHTML = '';
+    data.clothing.accessories.forEach(accessory => {
+        const li = document.createElement('li');
+        li.textContent = accessory;
+        accessoriesList.appendChild(li);
+    });
+
+    // Footwear
+    document.getElementById('footwear').textContent = data.clothing.footwear;
+
+    // Advice
+    const adviceBox = document.getElementById('advice');
+    adviceBox.innerHTML = '';
+    data.clothing.general_advice.forEach(tip => {
+        const p = document.createElement('p');
+        p.textContent = `• ${tip}`;
+        adviceBox.appendChild(p);
+    });
+
+    // Show results
+    results.style.display = 'block';
+    results.scrollIntoView({ behavior: 'smooth' });
+}
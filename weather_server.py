@@ -7,26 +7,186 @@ weather data and provides structured prompts for AI assistants.
 """
 
 import asyncio
-import json
-import os
+import re
+import time
 from typing import Any
 import httpx
-from openai import OpenAI
-from dotenv import load_dotenv
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+from diskcache import Cache
+import orjson
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
 
-# Load environment variables from .env file
-load_dotenv()
+from config import settings
 
 # Initialize the MCP server
 server = Server("weather-clothing-server")
 
+# HTTP client behind the OpenAI SDK. Its pool allows far more connections
+# than the SDK default, so bursts of recommendations do not queue behind
+# each other, and HTTP/2 multiplexes them over few connections
+OPENAI_HTTP_CLIENT = DefaultAsyncHttpxClient(
+    http2=True,
+    timeout=httpx.Timeout(30.0),
+    limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+)
+
 # Initialize OpenAI client (only if API key is available)
-openai_api_key = os.getenv("OPENAI_API_KEY")
-openai_client = OpenAI(api_key=openai_api_key) if openai_api_key else None
+openai_api_key = settings().openai_api_key
+openai_client = (
+    AsyncOpenAI(api_key=openai_api_key, http_client=OPENAI_HTTP_CLIENT)
+    if openai_api_key else None
+)
+
+# Checked up front so the no-key path goes straight to the local rules
+_USE_OPENAI = openai_client is not None
+
+# Request settings shared by every OpenAI call
+_OPENAI_KWARGS = {"model": "gpt-4o-mini", "temperature": 0.3}
+
+# Pooled HTTP client shared by all Open-Meteo calls; keep-alive connections
+# let repeat requests skip the TCP and TLS handshakes
+HTTP_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(10.0),
+    limits=httpx.Limits(
+        max_keepalive_connections=20,
+        max_connections=100,
+        keepalive_expiry=15.0
+    )
+)
+
+# Token bucket shared by all Open-Meteo calls (geocoding and forecast), so
+# bursts are smoothed out locally instead of being answered with HTTP 429
+open_meteo_limiter = AsyncLimiter(max_rate=settings().open_meteo_rate_limit, time_period=1)
+
+
+# Persistent store behind the in-memory caches below. It survives restarts
+# and is shared by every process on the machine, so a new server starts warm
+_DISK_CACHE = Cache(settings().cache_dir)
+
+# City coordinates effectively never change, so geocoding results are kept
+# in memory for a week and on disk for a year
+_GEO_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=7 * 24 * 60 * 60)
+_GEO_DISK_TTL = 365 * 24 * 60 * 60
+
+# Normalized city name -> geocoding request currently in flight
+_inflight_geo: dict[str, asyncio.Future] = {}
+
+# Current conditions only change meaningfully every few minutes
+_WEATHER_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=5 * 60)
+_WEATHER_DISK_TTL = 5 * 60
+
+# Rounded (latitude, longitude) -> forecast request currently in flight
+_inflight_weather: dict[tuple[float, float], asyncio.Future] = {}
+
+# OpenAI clothing recommendations by weather bucket (see _clothing_cache_key);
+# similar conditions get the same advice, so it is reused for a day
+_CLOTHING_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=24 * 60 * 60)
+_CLOTHING_DISK_TTL = 24 * 60 * 60
+
+# Weather bucket -> OpenAI clothing request currently in flight
+_inflight_clothing: dict[tuple[int, int, int, int], asyncio.Future] = {}
+
+# Normalized city name -> bundled coordinates, weather and clothing advice
+_FORECAST_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=5 * 60)
+_inflight_forecasts: dict[str, asyncio.Future] = {}
+
+# (tool name, city) -> (weather, clothing, rendered JSON) of the last tool result
+_TOOL_RESULT_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=5 * 60)
+
+# Characters ignored when comparing city names
+_CITY_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+async def _single_flight(inflight: dict, key, fetch):
+    """
+    Run an upstream lookup once per key, no matter how many callers want it.
+
+    The first caller for a key starts fetch() as a task and registers it in
+    ``inflight``; concurrent callers for the same key await that task instead
+    of issuing their own request. The entry is removed once the task finishes.
+
+    Args:
+        inflight: Mapping of key to the task currently fetching it
+        key: Cache key identifying the lookup
+        fetch: Zero-argument coroutine function performing the lookup
+
+    Returns:
+        The result of fetch(), shared by all concurrent callers
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+
+    # Shield so one cancelled request does not cancel the shared lookup
+    return await asyncio.shield(task)
+
+
+def _cache_get(cache: TTLCache, namespace: str, key) -> Any:
+    """
+    Look up a value in an in-memory cache, then in the persistent store.
+
+    A value found on disk is copied into memory, unless it expires on disk
+    before the memory cache would drop it (it is then re-read each time).
+
+    Args:
+        cache: In-memory cache consulted first
+        namespace: Name separating this cache's entries in the persistent store
+        key: Cache key
+
+    Returns:
+        The cached value, or None if neither layer has it
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    raw, expire_at = _DISK_CACHE.get((namespace, key), expire_time=True)
+    if raw is None:
+        return None
+
+    value = orjson.loads(raw)
+    if expire_at is None or expire_at - time.time() >= cache.ttl:
+        cache[key] = value
+    return value
+
+
+def _cache_set(cache: TTLCache, namespace: str, key, value: Any, expire: float):
+    """
+    Store a value in an in-memory cache and in the persistent store.
+
+    Args:
+        cache: In-memory cache to update
+        namespace: Name separating this cache's entries in the persistent store
+        key: Cache key
+        value: JSON-serializable value to store
+        expire: Seconds until the persistent copy expires
+    """
+    cache[key] = value
+    _DISK_CACHE.set((namespace, key), orjson.dumps(value), expire=expire)
+
+
+def _normalize_city(city: str) -> str:
+    """
+    Reduce a city name to its geocoding cache key.
+
+    Case, punctuation and extra whitespace are ignored, so "St. Louis",
+    "st louis" and " ST  LOUIS " share one key.
+
+    Args:
+        city: City name as entered by the user
+
+    Returns:
+        The normalized cache key
+    """
+    return " ".join(_CITY_PUNCTUATION.sub(" ", city).split()).casefold()
 
 
 async def get_coordinates(city_name: str) -> tuple[float, float]:
@@ -34,6 +194,36 @@ async def get_coordinates(city_name: str) -> tuple[float, float]:
     Convert a city name to geographic coordinates (latitude, longitude).
 
     Uses the Open-Meteo Geocoding API to find the coordinates of a city.
+    Results are cached under the normalized city name (see _normalize_city),
+    and concurrent misses for the same city share a single request.
+
+    Args:
+        city_name: Name of the city to look up
+
+    Returns:
+        A tuple containing (latitude, longitude) coordinates
+
+    Raises:
+        ValueError: If the city cannot be found
+    """
+    key = _normalize_city(city_name)
+
+    cached = _cache_get(_GEO_CACHE, "geo", key)
+    if cached is not None:
+        latitude, longitude = cached
+        return latitude, longitude
+
+    async def fetch():
+        coordinates = await _fetch_coordinates(city_name)
+        _cache_set(_GEO_CACHE, "geo", key, coordinates, _GEO_DISK_TTL)
+        return coordinates
+
+    return await _single_flight(_inflight_geo, key, fetch)
+
+
+async def _fetch_coordinates(city_name: str) -> tuple[float, float]:
+    """
+    Look up a city's coordinates with the Open-Meteo Geocoding API.
 
     Args:
         city_name: Name of the city to look up
@@ -44,18 +234,18 @@ async def get_coordinates(city_name: str) -> tuple[float, float]:
     Raises:
         ValueError: If the city cannot be found
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
+    async with open_meteo_limiter:
+        response = await HTTP_CLIENT.get(
             "https://geocoding-api.open-meteo.com/v1/search",
             params={"name": city_name, "count": 1, "language": "en", "format": "json"}
         )
-        data = response.json()
+    data = orjson.loads(response.content)
 
-        if not data.get("results"):
-            raise ValueError(f"City '{city_name}' not found")
+    if not data.get("results"):
+        raise ValueError(f"City '{city_name}' not found")
 
-        result = data["results"][0]
-        return result["latitude"], result["longitude"]
+    result = data["results"][0]
+    return result["latitude"], result["longitude"]
 
 
 async def get_weather(latitude: float, longitude: float) -> dict[str, Any]:
@@ -63,7 +253,7 @@ async def get_weather(latitude: float, longitude: float) -> dict[str, Any]:
     Fetch current weather data for given coordinates.
 
     Retrieves temperature, wind speed, humidity, and weather conditions
-    from the Open-Meteo API.
+    from the Open-Meteo API. Results are cached for a few minutes.
 
     Args:
         latitude: Geographic latitude
@@ -77,8 +267,35 @@ async def get_weather(latitude: float, longitude: float) -> dict[str, Any]:
         - weather_code: Numeric weather condition code
         - weather_description: Human-readable weather description
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
+    # Round to three decimals (roughly a 100 m grid) so nearby lookups share
+    # one cache entry; concurrent misses share a single forecast request
+    key = (round(latitude, 3), round(longitude, 3))
+
+    cached = _cache_get(_WEATHER_CACHE, "weather", key)
+    if cached is not None:
+        return cached
+
+    async def fetch():
+        weather = await _fetch_weather(latitude, longitude)
+        _cache_set(_WEATHER_CACHE, "weather", key, weather, _WEATHER_DISK_TTL)
+        return weather
+
+    return await _single_flight(_inflight_weather, key, fetch)
+
+
+async def _fetch_weather(latitude: float, longitude: float) -> dict[str, Any]:
+    """
+    Request current conditions from the Open-Meteo Forecast API.
+
+    Args:
+        latitude: Geographic latitude
+        longitude: Geographic longitude
+
+    Returns:
+        Dictionary containing weather information (see get_weather)
+    """
+    async with open_meteo_limiter:
+        response = await HTTP_CLIENT.get(
             "https://api.open-meteo.com/v1/forecast",
             params={
                 "latitude": latitude,
@@ -88,26 +305,75 @@ async def get_weather(latitude: float, longitude: float) -> dict[str, Any]:
                 "wind_speed_unit": "kmh"
             }
         )
-        data = response.json()
-
-        current = data["current"]
-        weather_code = current["weather_code"]
-
-        return {
-            "temperature": current["temperature_2m"],
-            "wind_speed": current["wind_speed_10m"],
-            "humidity": current["relative_humidity_2m"],
-            "weather_code": weather_code,
-            "weather_description": get_weather_description(weather_code)
-        }
+    data = orjson.loads(response.content)
+
+    current = data["current"]
+    weather_code = current["weather_code"]
+
+    description = get_weather_description(weather_code)
+
+    return {
+        "temperature": current["temperature_2m"],
+        "wind_speed": current["wind_speed_10m"],
+        "humidity": current["relative_humidity_2m"],
+        "weather_code": weather_code,
+        "weather_description": description
+    }
+
+
+# Standard descriptions for every WMO weather code Open-Meteo reports
+_WMO_DESCRIPTIONS = {
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Foggy",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    71: "Slight snow",
+    73: "Moderate snow",
+    75: "Heavy snow",
+    77: "Snow grains",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail"
+}
+
+# The same table indexed directly by code (0-99), None where a code is
+# undefined; warm_weather_descriptions() fills the gaps at startup
+_WMO_ARR = tuple(_WMO_DESCRIPTIONS.get(code) for code in range(100))
+
+# OpenAI-written descriptions for the undefined codes are kept for a month
+_DESCRIPTIONS_DISK_TTL = 30 * 24 * 60 * 60
+
+_DESCRIPTION_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a weather expert. Convert WMO weather codes to brief, natural weather descriptions. Respond with a JSON object only."
+}
+
+_DESCRIPTION_OAI_KWARGS = {
+    **_OPENAI_KWARGS,
+    "max_tokens": 2000,
+    "response_format": {"type": "json_object"}
+}
 
 
 def get_weather_description(code: int) -> str:
     """
-    Convert a numeric weather code to a human-readable description using AI.
+    Convert a numeric weather code to a human-readable description.
 
-    Uses OpenAI to interpret WMO Weather codes and provide natural descriptions.
-    Falls back to a standard dictionary if OpenAI is unavailable.
+    Known WMO codes come from a local table; descriptions for the remaining
+    codes are filled in once at startup (see warm_weather_descriptions).
 
     Args:
         code: WMO weather code (0-99)
@@ -115,88 +381,296 @@ def get_weather_description(code: int) -> str:
     Returns:
         Text description of the weather condition
     """
-    try:
-        # Check if OpenAI client is available
-        if openai_client is None:
-            raise ValueError("OpenAI API key not set")
-
-        # Use OpenAI to generate description
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a weather expert. Convert WMO weather codes to brief, natural weather descriptions. Respond with only the weather description, no extra text."
-                },
-                {
-                    "role": "user",
-                    "content": f"What is the weather condition for WMO code {code}? Provide a brief 2-4 word description."
-                }
-            ],
-            temperature=0.3,
-            max_tokens=20
-        )
+    description = _WMO_ARR[code] if 0 <= code < len(_WMO_ARR) else None
+    return description or "Unknown weather condition"
 
-        description = response.choices[0].message.content.strip()
-        return description
-
-    except Exception:
-        # Fallback to hardcoded descriptions
-        weather_codes = {
-            0: "Clear sky",
-            1: "Mainly clear",
-            2: "Partly cloudy",
-            3: "Overcast",
-            45: "Foggy",
-            48: "Depositing rime fog",
-            51: "Light drizzle",
-            53: "Moderate drizzle",
-            55: "Dense drizzle",
-            61: "Slight rain",
-            63: "Moderate rain",
-            65: "Heavy rain",
-            71: "Slight snow",
-            73: "Moderate snow",
-            75: "Heavy snow",
-            77: "Snow grains",
-            80: "Slight rain showers",
-            81: "Moderate rain showers",
-            82: "Violent rain showers",
-            85: "Slight snow showers",
-            86: "Heavy snow showers",
-            95: "Thunderstorm",
-            96: "Thunderstorm with slight hail",
-            99: "Thunderstorm with heavy hail"
-        }
-        return weather_codes.get(code, "Unknown weather condition")
 
+async def warm_weather_descriptions():
+    """
+    Fill in descriptions for the WMO codes missing from the local table.
 
-def recommend_clothing(weather: dict[str, Any]) -> dict[str, Any]:
+    OpenAI describes all missing codes in a single request, and the answer
+    is kept in the persistent cache, so later starts reuse it and lookups
+    never wait on OpenAI. Without OpenAI, or if the request fails, those
+    codes stay "Unknown weather condition".
     """
-    Suggest appropriate clothing based on weather conditions using OpenAI API.
+    global _WMO_ARR
+
+    missing = [code for code, description in enumerate(_WMO_ARR) if description is None]
+    if not missing:
+        return
+
+    raw = _DISK_CACHE.get(("descriptions", "wmo"))
+    if raw is not None:
+        generated = orjson.loads(raw)
+    elif _USE_OPENAI:
+        try:
+            generated = await _openai_describe_codes(missing)
+        except Exception:
+            return  # Retried on the next start
+        _DISK_CACHE.set(("descriptions", "wmo"), orjson.dumps(generated), expire=_DESCRIPTIONS_DISK_TTL)
+    else:
+        return
+
+    _WMO_ARR = tuple(
+        description or generated.get(str(code))
+        for code, description in enumerate(_WMO_ARR)
+    )
 
-    Uses OpenAI's gpt-4o-mini model to generate intelligent clothing
-    recommendations based on current weather data.
+
+async def _openai_describe_codes(codes: list[int]) -> dict[str, str]:
+    """
+    Ask OpenAI to describe several WMO weather codes in one request.
+
+    Args:
+        codes: WMO weather codes missing from the local table
+
+    Returns:
+        Mapping of code (as a string) to description, for every code the
+        model answered with a non-empty string
+    """
+    response = await openai_client.chat.completions.create(
+        messages=[
+            _DESCRIPTION_SYSTEM_MSG,
+            {
+                "role": "user",
+                "content": f"Provide a brief 2-4 word description for each of these WMO weather codes: {', '.join(map(str, codes))}. Respond with a JSON object mapping each code to its description."
+            }
+        ],
+        **_DESCRIPTION_OAI_KWARGS
+    )
+
+    answer = orjson.loads(response.choices[0].message.content)
+
+    descriptions = {}
+    for code in codes:
+        description = answer.get(str(code))
+        if isinstance(description, str) and description.strip():
+            descriptions[str(code)] = description.strip()
+    return descriptions
+
+
+# Fallback clothing rules, used when OpenAI is unavailable.
+#
+# _clothing_features() reduces the weather to a small integer of feature
+# flags using only numeric comparisons; _fallback_clothing() decodes those
+# flags into text using the tables below, indexed by temperature band and
+# precipitation condition.
+_TEMP_FREEZING, _TEMP_COLD, _TEMP_MILD, _TEMP_WARM = range(4)
+_TEMP_BAND_MASK = 0b11
+_FEATURE_WINDY = 1 << 2
+_FEATURE_SUNNY = 1 << 3
+_CONDITION_SHIFT = 4
+_CONDITION_NONE, _CONDITION_RAIN, _CONDITION_SNOW, _CONDITION_STORM = range(4)
+
+# WMO codes grouped by the conditions the fallback rules react to
+_RAIN_CODES = frozenset({51, 53, 55, 61, 63, 65, 80, 81, 82})
+_SNOW_CODES = frozenset({71, 73, 75, 77, 85, 86})
+_STORM_CODES = frozenset({95, 96, 99})
+_CLEAR_CODES = frozenset({0, 1})
+
+_BAND_LAYERS = (
+    ("Thermal underwear", "Warm sweater or fleece", "Heavy winter coat"),
+    ("Long-sleeve shirt", "Sweater or light jacket", "Medium coat"),
+    ("T-shirt or long-sleeve shirt", "Light jacket or cardigan"),
+    ("T-shirt or light shirt", "Optional: light cardigan"),
+)
+_BAND_ACCESSORIES = (
+    ("Warm hat", "Insulated gloves", "Scarf"),
+    ("Light hat or beanie", "Light gloves"),
+    (),
+    (),
+)
+_BAND_FOOTWEAR = (
+    "Insulated winter boots",
+    "Closed-toe shoes or boots",
+    "Comfortable shoes or sneakers",
+    "Sandals, sneakers, or light shoes",
+)
+_BAND_ADVICE = (
+    "Dress in multiple layers to trap warmth",
+    "A light jacket should be sufficient",
+    "Pleasant temperature, light layers recommended",
+    "Warm weather, dress lightly and stay hydrated",
+)
+
+_CONDITION_ACCESSORIES = (
+    (),
+    ("Umbrella", "Raincoat or waterproof jacket"),
+    ("Waterproof gloves",),
+    ("Waterproof jacket",),
+)
+_CONDITION_FOOTWEAR = (
+    None,
+    "Waterproof shoes or boots",
+    "Waterproof insulated boots",
+    None,
+)
+_CONDITION_ADVICE = (
+    None,
+    "Rain expected - bring waterproof gear",
+    "Snow conditions - wear waterproof footwear",
+    "Thunderstorm conditions - stay indoors if possible",
+)
+
+_WIND_ACCESSORY = "Windbreaker or wind-resistant jacket"
+_WIND_ADVICE = "Strong winds at {wind_speed} km/h - wear wind-resistant clothing"
+_SUN_ACCESSORIES = ("Sunglasses", "Sunscreen", "Hat for sun protection")
+
+
+def _clothing_features(temp: float, wind_speed: float, weather_code: int) -> int:
+    """
+    Reduce weather readings to the feature flags used by the fallback rules.
+
+    Args:
+        temp: Temperature in Celsius
+        wind_speed: Wind speed in km/h
+        weather_code: WMO weather code
+
+    Returns:
+        Bit mask holding the temperature band (bits 0-1), the windy and
+        sunny flags, and the precipitation condition (from bit 4 up)
+    """
+    # Temperature band
+    if temp < 0:
+        features = _TEMP_FREEZING
+    elif temp < 10:
+        features = _TEMP_COLD
+    elif temp < 20:
+        features = _TEMP_MILD
+    else:
+        features = _TEMP_WARM
+
+    # Wind considerations
+    if wind_speed > 20:
+        features |= _FEATURE_WINDY
+
+    # Weather condition
+    if weather_code in _RAIN_CODES:
+        features |= _CONDITION_RAIN << _CONDITION_SHIFT
+    elif weather_code in _SNOW_CODES:
+        features |= _CONDITION_SNOW << _CONDITION_SHIFT
+    elif weather_code in _STORM_CODES:
+        features |= _CONDITION_STORM << _CONDITION_SHIFT
+
+    # Sun protection for clear weather and high temperatures
+    if weather_code in _CLEAR_CODES and temp > 20:
+        features |= _FEATURE_SUNNY
+
+    return features
+
+
+def _fallback_clothing(features: int) -> dict[str, Any]:
+    """
+    Build basic clothing recommendations from fallback feature flags.
+
+    The wind advice is left as the _WIND_ADVICE template, since it quotes
+    the actual wind speed.
+
+    Args:
+        features: Bit mask produced by _clothing_features()
+
+    Returns:
+        Dictionary with the same keys as recommend_clothing()
+    """
+    band = features & _TEMP_BAND_MASK
+    condition = features >> _CONDITION_SHIFT
+
+    layers = list(_BAND_LAYERS[band])
+    accessories = list(_BAND_ACCESSORIES[band])
+    footwear = _BAND_FOOTWEAR[band]
+    advice = [_BAND_ADVICE[band]]
+
+    if features & _FEATURE_WINDY:
+        accessories.append(_WIND_ACCESSORY)
+        advice.append(_WIND_ADVICE)
+
+    if condition != _CONDITION_NONE:
+        accessories.extend(_CONDITION_ACCESSORIES[condition])
+        footwear = _CONDITION_FOOTWEAR[condition] or footwear
+        advice.append(_CONDITION_ADVICE[condition])
+
+    if features & _FEATURE_SUNNY:
+        accessories.extend(_SUN_ACCESSORIES)
+
+    return {
+        "layers": tuple(layers),
+        "accessories": tuple(dict.fromkeys(accessories)),
+        "footwear": footwear,
+        "general_advice": tuple(advice)
+    }
+
+
+# Fallback recommendations for every possible feature mask, built once at
+# import so the fallback path is a single tuple index
+_FALLBACK_TABLE = tuple(
+    _fallback_clothing(features)
+    for features in range((_CONDITION_STORM + 1) << _CONDITION_SHIFT)
+)
+
+
+def _lookup_fallback_clothing(weather: dict[str, Any]) -> dict[str, Any]:
+    """
+    Look up the precomputed fallback recommendations for the given weather.
+
+    Entries are shared between calls; their lists are stored as tuples so
+    they cannot be modified in place, and no new containers are allocated
+    unless the wind advice needs the live wind speed.
 
     Args:
         weather: Dictionary containing weather data (temperature, wind_speed,
-                humidity, weather_code, weather_description)
+                weather_code)
 
     Returns:
-        Dictionary with clothing recommendations:
-        - layers: List of recommended clothing layers
-        - accessories: List of recommended accessories
-        - footwear: Recommended footwear type
-        - general_advice: Additional tips
+        Dictionary with the same keys as recommend_clothing()
     """
-    # Build detailed prompt for OpenAI
-    prompt = f"""You are a professional clothing advisor. Analyze these EXACT weather conditions and provide appropriate clothing recommendations:
+    wind_speed = weather["wind_speed"]
+    features = _clothing_features(weather["temperature"], wind_speed, weather["weather_code"])
+    clothing = _FALLBACK_TABLE[features]
+
+    if features & _FEATURE_WINDY:
+        # Fill in the live wind speed quoted by the wind advice
+        clothing = {
+            **clothing,
+            "general_advice": tuple(
+                tip.format(wind_speed=wind_speed) if tip is _WIND_ADVICE else tip
+                for tip in clothing["general_advice"]
+            )
+        }
+
+    return clothing
+
+
+def _clothing_cache_key(weather: dict[str, Any]) -> tuple[int, int, int, int]:
+    """
+    Quantize weather conditions into a clothing-cache bucket.
+
+    Temperature is rounded to 2°C, wind speed to 5 km/h and humidity to 10%,
+    which is finer than any of them changes the advice.
+
+    Args:
+        weather: Dictionary containing weather data (see get_weather)
+
+    Returns:
+        Tuple of (temperature, wind speed, humidity, weather code) buckets
+    """
+    return (
+        round(weather["temperature"] / 2) * 2,
+        round(weather["wind_speed"] / 5) * 5,
+        round(weather["humidity"] / 10) * 10,
+        weather["weather_code"]
+    )
+
+
+# Instructions sent with every clothing request; only the weather readings
+# are filled in per call
+_CLOTHING_PROMPT_TEMPLATE = """You are a professional clothing advisor. Analyze these EXACT weather conditions and provide appropriate clothing recommendations:
 
 CURRENT WEATHER CONDITIONS:
-Temperature: {weather['temperature']}°C
-Weather Condition: {weather['weather_description']}
-Wind Speed: {weather['wind_speed']} km/h
-Humidity: {weather['humidity']}%
+Temperature: {temperature}°C
+Weather Condition: {weather_description}
+Wind Speed: {wind_speed} km/h
+Humidity: {humidity}%
 
 IMPORTANT GUIDELINES:
 - For temperatures BELOW 0°C: Recommend heavy winter gear (thermal underwear, heavy coat, insulated boots)
@@ -218,114 +692,163 @@ Respond with ONLY a JSON object (no markdown, no code blocks):
 
 Base your recommendations STRICTLY on the temperature and weather conditions provided above."""
 
-    try:
-        # Check if OpenAI client is available
-        if openai_client is None:
-            raise ValueError("OpenAI API key not set")
-
-        # Call OpenAI API
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional clothing advisor. Your recommendations MUST match the exact weather conditions provided. Be specific and practical. Different weather conditions require different clothing. Always respond with valid JSON only."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.3,
-            max_tokens=500
-        )
+_CLOTHING_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a professional clothing advisor. Your recommendations MUST match the exact weather conditions provided. Be specific and practical. Different weather conditions require different clothing. Always respond with valid JSON only."
+}
+
+
+# Structured output schema, so OpenAI always answers with the
+# recommend_clothing() keys and nothing else
+_CLOTHING_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "clothing_recommendation",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "layers": {"type": "array", "items": {"type": "string"}},
+                "accessories": {"type": "array", "items": {"type": "string"}},
+                "footwear": {"type": "string"},
+                "general_advice": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["layers", "accessories", "footwear", "general_advice"],
+            "additionalProperties": False
+        }
+    }
+}
 
-        # Parse response
-        response_text = response.choices[0].message.content.strip()
+_CLOTHING_OAI_KWARGS = {
+    **_OPENAI_KWARGS,
+    "max_tokens": 500,
+    "response_format": _CLOTHING_RESPONSE_FORMAT
+}
 
-        # Remove markdown code blocks if present
-        if response_text.startswith("```"):
-            response_text = response_text.split("```")[1]
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
-            response_text = response_text.strip()
 
-        clothing_data = json.loads(response_text)
+async def recommend_clothing(weather: dict[str, Any]) -> dict[str, Any]:
+    """
+    Suggest appropriate clothing based on weather conditions using OpenAI API.
 
-        # Validate structure
-        required_keys = ["layers", "accessories", "footwear", "general_advice"]
-        if all(key in clothing_data for key in required_keys):
-            return clothing_data
-        else:
-            raise ValueError("Invalid response structure from OpenAI")
+    Uses OpenAI's gpt-4o-mini model to generate intelligent clothing
+    recommendations based on current weather data. Recommendations are
+    cached by weather bucket (see _clothing_cache_key), so similar
+    conditions reuse an earlier answer. Without an OpenAI API key the
+    fallback rules are used directly.
+
+    Args:
+        weather: Dictionary containing weather data (temperature, wind_speed,
+                humidity, weather_code, weather_description)
+
+    Returns:
+        Dictionary with clothing recommendations (lists may be tuples when
+        the fallback rules are used; treat the result as read-only):
+        - layers: List of recommended clothing layers
+        - accessories: List of recommended accessories
+        - footwear: Recommended footwear type
+        - general_advice: Additional tips
+    """
+    if not _USE_OPENAI:
+        return _lookup_fallback_clothing(weather)
+
+    key = _clothing_cache_key(weather)
+
+    cached = _cache_get(_CLOTHING_CACHE, "clothing", key)
+    if cached is not None:
+        return cached
+
+    async def fetch():
+        clothing_data = await _openai_recommend_clothing(weather)
+        _cache_set(_CLOTHING_CACHE, "clothing", key, clothing_data, _CLOTHING_DISK_TTL)
+        return clothing_data
+
+    try:
+        # Concurrent requests for the same weather bucket share one OpenAI call
+        return await _single_flight(_inflight_clothing, key, fetch)
 
     except Exception as e:
         # Fallback to basic recommendations if API fails
         print(f"Warning: OpenAI API failed ({str(e)}), using fallback recommendations")
 
-        temp = weather["temperature"]
-        wind_speed = weather["wind_speed"]
-        weather_code = weather["weather_code"]
-
-        layers = []
-        accessories = []
-        footwear = "Regular shoes"
-        advice = []
-
-        # Temperature-based recommendations
-        if temp < 0:
-            layers = ["Thermal underwear", "Warm sweater or fleece", "Heavy winter coat"]
-            accessories.append("Warm hat")
-            accessories.append("Insulated gloves")
-            accessories.append("Scarf")
-            footwear = "Insulated winter boots"
-            advice.append("Dress in multiple layers to trap warmth")
-        elif temp < 10:
-            layers = ["Long-sleeve shirt", "Sweater or light jacket", "Medium coat"]
-            accessories.append("Light hat or beanie")
-            accessories.append("Light gloves")
-            footwear = "Closed-toe shoes or boots"
-            advice.append("A light jacket should be sufficient")
-        elif temp < 20:
-            layers = ["T-shirt or long-sleeve shirt", "Light jacket or cardigan"]
-            footwear = "Comfortable shoes or sneakers"
-            advice.append("Pleasant temperature, light layers recommended")
-        else:
-            layers = ["T-shirt or light shirt", "Optional: light cardigan"]
-            footwear = "Sandals, sneakers, or light shoes"
-            advice.append("Warm weather, dress lightly and stay hydrated")
-
-        # Wind considerations
-        if wind_speed > 20:
-            accessories.append("Windbreaker or wind-resistant jacket")
-            advice.append(f"Strong winds at {wind_speed} km/h - wear wind-resistant clothing")
-
-        # Weather condition recommendations
-        if weather_code in [51, 53, 55, 61, 63, 65, 80, 81, 82]:  # Rain
-            accessories.append("Umbrella")
-            accessories.append("Raincoat or waterproof jacket")
-            footwear = "Waterproof shoes or boots"
-            advice.append("Rain expected - bring waterproof gear")
-        elif weather_code in [71, 73, 75, 77, 85, 86]:  # Snow
-            accessories.append("Waterproof gloves")
-            footwear = "Waterproof insulated boots"
-            advice.append("Snow conditions - wear waterproof footwear")
-        elif weather_code in [95, 96, 99]:  # Thunderstorm
-            accessories.append("Waterproof jacket")
-            advice.append("Thunderstorm conditions - stay indoors if possible")
-
-        # Sun protection for clear weather and high temperatures
-        if weather_code in [0, 1] and temp > 20:
-            accessories.append("Sunglasses")
-            accessories.append("Sunscreen")
-            accessories.append("Hat for sun protection")
-
-        return {
-            "layers": layers,
-            "accessories": list(set(accessories)),
-            "footwear": footwear,
-            "general_advice": advice
+        return _lookup_fallback_clothing(weather)
+
+
+async def _openai_recommend_clothing(weather: dict[str, Any]) -> dict[str, Any]:
+    """
+    Ask OpenAI for clothing recommendations for the given weather.
+
+    Args:
+        weather: Dictionary containing weather data (see get_weather)
+
+    Returns:
+        Dictionary with the same keys as recommend_clothing()
+
+    Raises:
+        ValueError: If OpenAI declines to answer
+    """
+    # Build detailed prompt for OpenAI
+    prompt = _CLOTHING_PROMPT_TEMPLATE.format_map(weather)
+
+    # Call OpenAI API
+    response = await openai_client.chat.completions.create(
+        messages=[
+            _CLOTHING_SYSTEM_MSG,
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        **_CLOTHING_OAI_KWARGS
+    )
+
+    message = response.choices[0].message
+    if message.refusal:
+        raise ValueError(f"OpenAI declined the request: {message.refusal}")
+
+    # The schema guarantees well-formed JSON with every required key
+    return orjson.loads(message.content)
+
+
+async def fetch_city_forecast(city: str) -> dict[str, Any]:
+    """
+    Look up a city's coordinates, current weather and clothing advice.
+
+    This is the full pipeline behind the tools, the prompt and the web API.
+    The bundle is cached under the normalized city name for a few minutes,
+    and concurrent requests for the same city share a single run.
+
+    Args:
+        city: Name of the city to look up
+
+    Returns:
+        Dictionary with keys:
+        - latitude: Geographic latitude of the city
+        - longitude: Geographic longitude of the city
+        - weather: Weather data (see get_weather)
+        - clothing: Clothing recommendations (see recommend_clothing)
+
+    Raises:
+        ValueError: If the city cannot be found
+    """
+    key = _normalize_city(city)
+
+    cached = _FORECAST_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    async def fetch():
+        latitude, longitude = await get_coordinates(city)
+        weather = await get_weather(latitude, longitude)
+        forecast = {
+            "latitude": latitude,
+            "longitude": longitude,
+            "weather": weather,
+            "clothing": await recommend_clothing(weather)
         }
+        _FORECAST_CACHE[key] = forecast
+        return forecast
+
+    return await _single_flight(_inflight_forecasts, key, fetch)
 
 
 @server.list_prompts()
@@ -355,6 +878,47 @@ async def handle_list_prompts() -> list[types.Prompt]:
     ]
 
 
+# Prompt returned by weather_advice; list sections are pre-rendered bullets
+_ADVICE_PROMPT_TEMPLATE = """Based on current weather in {city}, provide advice for: {activity}
+
+Weather Conditions:
+- Temperature: {weather[temperature]}°C
+- Conditions: {weather[weather_description]}
+- Wind Speed: {weather[wind_speed]} km/h
+- Humidity: {weather[humidity]}%
+
+Clothing Recommendations:
+Layers:
+{layers}
+
+Accessories:
+{accessories}
+
+Footwear: {footwear}
+
+General Advice:
+{general_advice}
+
+Please provide:
+1. Is the weather suitable for {activity}?
+2. What precautions should be taken?
+3. What is the best time of day for this activity?
+4. Any alternative suggestions if conditions aren't ideal?"""
+
+
+def _bullet_list(items) -> str:
+    """
+    Render items as an indented bullet list, one item per line.
+
+    Args:
+        items: Strings to list
+
+    Returns:
+        The bullet lines joined with newlines
+    """
+    return "\n".join(f"  - {item}" for item in items)
+
+
 @server.get_prompt()
 async def handle_get_prompt(
     name: str, arguments: dict[str, str] | None
@@ -388,38 +952,23 @@ async def handle_get_prompt(
 
     # Fetch weather data
     try:
-        latitude, longitude = await get_coordinates(city)
-        weather = await get_weather(latitude, longitude)
-        clothing = recommend_clothing(weather)
+        forecast = await fetch_city_forecast(city)
     except Exception as e:
         raise ValueError(f"Failed to fetch weather data: {str(e)}")
 
-    # Build structured prompt
-    prompt_text = f"""Based on current weather in {city}, provide advice for: {activity}
-
-Weather Conditions:
-- Temperature: {weather['temperature']}°C
-- Conditions: {weather['weather_description']}
-- Wind Speed: {weather['wind_speed']} km/h
-- Humidity: {weather['humidity']}%
+    weather = forecast["weather"]
+    clothing = forecast["clothing"]
 
-Clothing Recommendations:
-Layers:
-{chr(10).join(f'  - {layer}' for layer in clothing['layers'])}
-
-Accessories:
-{chr(10).join(f'  - {item}' for item in clothing['accessories'])}
-
-Footwear: {clothing['footwear']}
-
-General Advice:
-{chr(10).join(f'  - {tip}' for tip in clothing['general_advice'])}
-
-Please provide:
-1. Is the weather suitable for {activity}?
-2. What precautions should be taken?
-3. What is the best time of day for this activity?
-4. Any alternative suggestions if conditions aren't ideal?"""
+    # Build structured prompt
+    prompt_text = _ADVICE_PROMPT_TEMPLATE.format(
+        city=city,
+        activity=activity,
+        weather=weather,
+        footwear=clothing["footwear"],
+        layers=_bullet_list(clothing["layers"]),
+        accessories=_bullet_list(clothing["accessories"]),
+        general_advice=_bullet_list(clothing["general_advice"])
+    )
 
     return types.GetPromptResult(
         description=f"Weather advice for {activity} in {city}",
@@ -474,6 +1023,44 @@ async def handle_list_tools() -> list[types.Tool]:
     ]
 
 
+def _render_tool_result(
+    name: str,
+    city: str,
+    weather: dict[str, Any],
+    clothing: dict[str, Any] | None = None
+) -> str:
+    """
+    Serialize a tool result as indented JSON, reusing earlier renderings.
+
+    The weather and clothing dictionaries come from the module caches, so
+    while they are unchanged the previous rendering for the same tool and
+    city is returned as-is. A refreshed cache entry is a new object and is
+    rendered again.
+
+    Args:
+        name: Name of the tool being answered
+        city: City name as given by the client
+        weather: Weather data (see get_weather)
+        clothing: Clothing recommendations, for get_clothing_recommendation
+
+    Returns:
+        The JSON text of the tool result
+    """
+    key = (name, city)
+
+    cached = _TOOL_RESULT_CACHE.get(key)
+    if cached is not None and cached[0] is weather and cached[1] is clothing:
+        return cached[2]
+
+    result = {"city": city, "weather": weather}
+    if clothing is not None:
+        result["clothing_recommendation"] = clothing
+
+    text = orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+    _TOOL_RESULT_CACHE[key] = (weather, clothing, text)
+    return text
+
+
 @server.call_tool()
 async def handle_call_tool(
     name: str, arguments: dict | None
@@ -502,32 +1089,25 @@ async def handle_call_tool(
         raise ValueError("City name is required")
 
     try:
-        latitude, longitude = await get_coordinates(city)
-        weather = await get_weather(latitude, longitude)
-
         if name == "get_weather":
-            result = {
-                "city": city,
-                "weather": weather
-            }
+            # Weather alone does not need the clothing recommendation
+            latitude, longitude = await get_coordinates(city)
+            weather = await get_weather(latitude, longitude)
             return [
                 types.TextContent(
                     type="text",
-                    text=json.dumps(result, indent=2)
+                    text=_render_tool_result(name, city, weather)
                 )
             ]
 
         elif name == "get_clothing_recommendation":
-            clothing = recommend_clothing(weather)
-            result = {
-                "city": city,
-                "weather": weather,
-                "clothing_recommendation": clothing
-            }
+            forecast = await fetch_city_forecast(city)
             return [
                 types.TextContent(
                     type="text",
-                    text=json.dumps(result, indent=2)
+                    text=_render_tool_result(
+                        name, city, forecast["weather"], forecast["clothing"]
+                    )
                 )
             ]
 
@@ -544,19 +1124,28 @@ async def main():
 
     Runs the server using standard input/output for communication.
     """
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="weather-clothing-server",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={}
+    # Describe any unknown weather codes in the background while serving
+    warmup = asyncio.create_task(warm_weather_descriptions())
+
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="weather-clothing-server",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={}
+                    )
                 )
             )
-        )
+    finally:
+        warmup.cancel()
+        await HTTP_CLIENT.aclose()
+        await OPENAI_HTTP_CLIENT.aclose()
+        _DISK_CACHE.close()
 
 
 if __name__ == "__main__":